@@ -6,10 +6,214 @@ Creates new files inside existing ZIP archives at specified paths.
 
 import zipfile
 import os
+import io
+import sys
+import copy
+import contextlib
+import shutil
+import struct
+import bisect
+import math
+import time
+import operator
 import argparse
 import tempfile
 import subprocess
-from pathlib import Path
+from collections import Counter
+
+# Chunk size used when streaming entry data between archives
+COPY_BUFFER_SIZE = 1 << 20
+
+# Translation table turning Windows separators into ZIP ('/') separators
+PATH_NORMALIZE = str.maketrans({'\\': '/'})
+
+# Editors tried in order by edit_with_external_editor()
+EDITOR_CANDIDATES = (
+    #os.environ.get('EDITOR'),
+    'nano', 'vim', 'vi', 'code', 'subl', 'atom', 'gedit', 'notepad'
+)
+
+# First characters accepted as yes/no answers by ask_bool()
+YES_ANSWERS = frozenset('yY1tT')
+NO_ANSWERS = frozenset('nN0fF')
+
+# Extensions whose content is normally compressed already
+STORED_EXTENSIONS = frozenset({'.mp3', '.mp4', '.jpg', '.jpeg', '.png', '.zip', '.gz', '.zst', '.webp'})
+
+# Optional faster deflate implementations (zlib-ng or Intel ISA-L), used
+# transparently for ZIP_DEFLATED entries when installed
+try:
+    from zlib_ng import zlib_ng as fast_zlib
+except ImportError:
+    try:
+        from isal import isal_zlib as fast_zlib
+    except ImportError:
+        fast_zlib = None
+
+if fast_zlib is not None:
+    _stdlib_get_compressor = zipfile._get_compressor
+    
+    def _fast_get_compressor(compress_type, compresslevel=None):
+        if compress_type == zipfile.ZIP_DEFLATED:
+            if compresslevel is None:
+                compresslevel = fast_zlib.Z_DEFAULT_COMPRESSION
+            return fast_zlib.compressobj(compresslevel, fast_zlib.DEFLATED, -15)
+        return _stdlib_get_compressor(compress_type, compresslevel)
+    
+    zipfile._get_compressor = _fast_get_compressor
+
+def local_header_size(item, header):
+    """Return the size of an entry's local file header from its fixed part."""
+    fields = struct.unpack(zipfile.structFileHeader, header)
+    if fields[zipfile._FH_SIGNATURE] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local file header for '{item.filename}'")
+    return (zipfile.sizeFileHeader + fields[zipfile._FH_FILENAME_LENGTH]
+            + fields[zipfile._FH_EXTRA_FIELD_LENGTH])
+
+def iter_file_range(fp, item, start, size):
+    """Yield `size` bytes of `item`'s record from `fp`, starting at `start`, in bounded chunks."""
+    fp.seek(start)
+    remaining = size
+    while remaining:
+        chunk = fp.read(min(remaining, COPY_BUFFER_SIZE))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated data for '{item.filename}'")
+        yield chunk
+        remaining -= len(chunk)
+
+def iter_raw_entry(fp, item):
+    """Yield the compressed data of `item` from `fp` in bounded chunks."""
+    fp.seek(item.header_offset)
+    header_size = local_header_size(item, fp.read(zipfile.sizeFileHeader))
+    yield from iter_file_range(fp, item, item.header_offset + header_size, item.compress_size)
+
+def keeps_local_header(item):
+    """
+    Return True if `item` must be copied with its original local header.
+    
+    With traditional PKWARE encryption the password check byte comes from
+    the DOS time instead of the CRC when a data descriptor is used, so
+    encrypted entries with a descriptor are copied exactly as stored:
+    header, data and descriptor.
+    """
+    return bool(item.flag_bits & 0x01 and item.flag_bits & 0x08)
+
+def write_raw_entry(new_zip, item, chunks):
+    """
+    Append an entry's already-compressed data to `new_zip`.
+    
+    For entries where keeps_local_header() is true, `chunks` must hold the
+    whole original record and no new header is written.
+    """
+    dst = new_zip.fp
+    info = copy.copy(item)
+    dst.seek(new_zip.start_dir)
+    info.header_offset = dst.tell()
+    if not keeps_local_header(item):
+        info.flag_bits &= ~0x08  # CRC and sizes go in the header, no data descriptor
+        # Drop the central directory's ZIP64 record; FileHeader() adds its own if needed
+        info.extra = zipfile._strip_extra(info.extra, (1,))
+        dst.write(info.FileHeader())
+    for chunk in chunks:
+        dst.write(chunk)
+    new_zip.start_dir = dst.tell()
+    
+    new_zip.filelist.append(info)
+    new_zip.NameToInfo[info.filename] = info
+
+def copy_zip_entries(original_zip, new_zip, exclude=None):
+    """
+    Copy every entry except `exclude`, and the archive comment, from one
+    open ZIP into another.
+    
+    The compressed data is transferred verbatim, so unchanged entries are
+    never decompressed and compressed again.
+    """
+    items = original_zip.infolist()
+    if exclude in original_zip.NameToInfo:
+        items = [item for item in items if item.filename != exclude]
+    
+    # Records copied as stored run up to the next local header or the
+    # central directory, which also covers their data descriptor
+    boundaries = sorted({info.header_offset for info in original_zip.filelist}
+                        | {original_zip.start_dir})
+    
+    def raw_chunks(item):
+        if keeps_local_header(item):
+            end = boundaries[bisect.bisect_right(boundaries, item.header_offset)]
+            return iter_file_range(original_zip.fp, item, item.header_offset, end - item.header_offset)
+        return iter_raw_entry(original_zip.fp, item)
+    
+    for item in items:
+        write_raw_entry(new_zip, item, raw_chunks(item))
+    
+    new_zip.comment = original_zip.comment
+    
+    # Make sure the central directory is written on close
+    new_zip._didModify = True
+
+@contextlib.contextmanager
+def open_zip_for_read(zip_path):
+    """
+    Open a ZIP archive for reading.
+    
+    Opening the file directly both validates that it exists and provides
+    the handle, so callers need no separate os.path.exists() check. The
+    1 MiB buffer cuts read() calls while parsing the central directory.
+    """
+    fd = os.open(zip_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    with os.fdopen(fd, 'rb', buffering=COPY_BUFFER_SIZE) as fp:
+        with zipfile.ZipFile(fp, 'r') as zip_file:
+            yield zip_file
+
+@contextlib.contextmanager
+def open_zip_for_append(zip_path):
+    """
+    Open an existing ZIP archive in append mode.
+    
+    zipfile would create a missing file, or append a new archive to a file
+    that is not a ZIP; both are refused here so such paths are left untouched.
+    """
+    fd = os.open(zip_path, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+    with os.fdopen(fd, 'r+b') as fp:
+        with zipfile.ZipFile(fp, 'a', zipfile.ZIP_DEFLATED) as zip_file:
+            # Only set at this point when no central directory was found
+            if zip_file._didModify:
+                zip_file._didModify = False
+                raise zipfile.BadZipFile("File is not a zip file")
+            yield zip_file
+
+def drop_trailing_entry(zip_file, name):
+    """
+    Drop `name` from a ZIP opened in append mode if it is the last entry.
+    
+    The next write then starts at the entry's local header, overwriting it
+    in place, and the file is truncated when the archive is closed.
+    Returns False, leaving the archive untouched, if `name` is not the
+    last entry or appears more than once.
+    """
+    tail = max(zip_file.filelist, key=operator.attrgetter('header_offset'))
+    if tail.filename != name or sum(item.filename == name for item in zip_file.filelist) != 1:
+        return False
+    
+    zip_file.filelist.remove(tail)
+    del zip_file.NameToInfo[name]
+    zip_file.start_dir = tail.header_offset
+    zip_file._didModify = True
+    return True
+
+def should_store(target_path, content):
+    """Return True if the `content` bytes are too small or too random to be worth deflating."""
+    if len(content) < 256:
+        return True
+    if os.path.splitext(target_path)[1].lower() in STORED_EXTENSIONS:
+        return True
+    
+    # Shannon entropy of a 4 KiB sample, in bits per byte
+    sample = content[:4096]
+    total = len(sample)
+    entropy = -sum(n / total * math.log2(n / total) for n in Counter(sample).values())
+    return entropy > 7.5
 
 def create_symlink_in_zip(zip_path, target_path, symlink_target, overwrite=False):
     """
@@ -24,45 +228,48 @@ def create_symlink_in_zip(zip_path, target_path, symlink_target, overwrite=False
     Returns:
         bool: True if successful, False otherwise
     """
-    if not os.path.exists(zip_path):
-        print(f"Error: ZIP file '{zip_path}' does not exist")
-        return False
-    
     # Normalize the target path (use forward slashes for ZIP)
-    target_path = target_path.replace('\\', '/')
+    target_path = target_path.translate(PATH_NORMALIZE)
+    
+    temp_zip = zip_path + '.tmp'
     
     try:
-        # Create a temporary copy of the ZIP
-        temp_zip = zip_path + '.tmp'
+        # Create symlink entry
+        # In ZIP files, symlinks are stored as regular files containing the target path
+        # with special external attributes to indicate it's a symlink
+        info = zipfile.ZipInfo(target_path)
+        info.create_system = 3  # Unix
+        info.external_attr = (0o120000 | 0o755) << 16  # S_IFLNK | permissions
+        info.compress_type = zipfile.ZIP_STORED  # targets are tiny, never worth deflating
         
-        with zipfile.ZipFile(zip_path, 'r') as original_zip:
-            with zipfile.ZipFile(temp_zip, 'w', zipfile.ZIP_DEFLATED) as new_zip:
-                # Copy all existing files
-                for item in original_zip.infolist():
-                    # Skip if we're about to overwrite and overwrite is False
-                    if item.filename == target_path and not overwrite:
-                        print(f"File '{target_path}' already exists. Use --overwrite to replace it.")
-                        os.remove(temp_zip)
-                        return False
-                    
-                    # Copy existing file (unless we're overwriting it)
-                    if item.filename != target_path:
-                        data = original_zip.read(item.filename)
-                        new_zip.writestr(item, data)
-                
-                # Create symlink entry
-                # In ZIP files, symlinks are stored as regular files containing the target path
-                # with special external attributes to indicate it's a symlink
-                info = zipfile.ZipInfo(target_path)
-                info.create_system = 3  # Unix
-                info.external_attr = (0o120000 | 0o755) << 16  # S_IFLNK | permissions
-                new_zip.writestr(info, symlink_target.encode('utf-8'))
+        # New entries, and replacements of the last entry, are written in place:
+        # only the tail of the file and the central directory change
+        with open_zip_for_append(zip_path) as zip_file:
+            exists = target_path in zip_file.NameToInfo
+            if exists and not overwrite:
+                print(f"File '{target_path}' already exists. Use --overwrite to replace it.")
+                return False
+            
+            in_place = not exists or drop_trailing_entry(zip_file, target_path)
+            if in_place:
+                zip_file.writestr(info, symlink_target.encode('utf-8'))
+            else:
+                # Overwriting in the middle: copy every other entry into a temporary
+                # ZIP, reusing the central directory parsed by the append-mode open
+                with zipfile.ZipFile(temp_zip, 'w', zipfile.ZIP_DEFLATED) as new_zip:
+                    copy_zip_entries(zip_file, new_zip, exclude=target_path)
+                    new_zip.writestr(info, symlink_target.encode('utf-8'))
+        
+        if not in_place:
+            # Replace original with modified version
+            os.replace(temp_zip, zip_path)
         
-        # Replace original with modified version
-        os.replace(temp_zip, zip_path)
         print(f"Successfully created symlink '{target_path}' -> '{symlink_target}' in '{zip_path}'")
         return True
         
+    except FileNotFoundError:
+        print(f"Error: ZIP file '{zip_path}' does not exist")
+        return False
     except zipfile.BadZipFile:
         print(f"Error: '{zip_path}' is not a valid ZIP file")
         if os.path.exists(temp_zip):
@@ -81,46 +288,65 @@ def create_file_in_zip(zip_path, target_path, file_content="", overwrite=False):
     Args:
         zip_path (str): Path to the ZIP file
         target_path (str): Path inside the ZIP where file should be created
-        file_content (str): Content to write to the file
+        file_content (str or bytes): Content to write to the file (str is UTF-8 encoded)
         overwrite (bool): Whether to overwrite existing files
     
     Returns:
         bool: True if successful, False otherwise
     """
-    if not os.path.exists(zip_path):
-        print(f"Error: ZIP file '{zip_path}' does not exist")
-        return False
-    
     # Normalize the target path (use forward slashes for ZIP)
-    target_path = target_path.replace('\\', '/')
+    target_path = target_path.translate(PATH_NORMALIZE)
+    
+    temp_zip = zip_path + '.tmp'
     
     try:
-        # Create a temporary copy of the ZIP
-        temp_zip = zip_path + '.tmp'
+        # Encode once up front so zipfile gets bytes straight into crc32/deflate
+        if isinstance(file_content, str):
+            file_content = file_content.encode('utf-8')
         
-        with zipfile.ZipFile(zip_path, 'r') as original_zip:
-            with zipfile.ZipFile(temp_zip, 'w', zipfile.ZIP_DEFLATED) as new_zip:
-                # Copy all existing files
-                for item in original_zip.infolist():
-                    # Skip if we're about to overwrite and overwrite is False
-                    if item.filename == target_path and not overwrite:
-                        print(f"File '{target_path}' already exists. Use --overwrite to replace it.")
-                        os.remove(temp_zip)
-                        return False
-                    
-                    # Copy existing file (unless we're overwriting it)
-                    if item.filename != target_path:
-                        data = original_zip.read(item.filename)
-                        new_zip.writestr(item, data)
-                
-                # Add the new file
-                new_zip.writestr(target_path, file_content)
+        entry = target_path
+        if not file_content:
+            # Empty files and directories: a stored entry needs no compressor
+            # and no entropy check, only the headers are written
+            entry = zipfile.ZipInfo(target_path, time.localtime()[:6])
+            if entry.is_dir():
+                entry.external_attr = 0o40775 << 16 | 0x10  # drwxrwxr-x, MS-DOS directory flag
+            else:
+                entry.external_attr = 0o600 << 16  # -rw-------
+            compress_type = zipfile.ZIP_STORED
+        elif should_store(target_path, file_content):
+            compress_type = zipfile.ZIP_STORED
+        else:
+            compress_type = zipfile.ZIP_DEFLATED
+        
+        # New entries, and replacements of the last entry, are written in place:
+        # only the tail of the file and the central directory change
+        with open_zip_for_append(zip_path) as zip_file:
+            exists = target_path in zip_file.NameToInfo
+            if exists and not overwrite:
+                print(f"File '{target_path}' already exists. Use --overwrite to replace it.")
+                return False
+            
+            in_place = not exists or drop_trailing_entry(zip_file, target_path)
+            if in_place:
+                zip_file.writestr(entry, file_content, compress_type=compress_type)
+            else:
+                # Overwriting in the middle: copy every other entry into a temporary
+                # ZIP, reusing the central directory parsed by the append-mode open
+                with zipfile.ZipFile(temp_zip, 'w', zipfile.ZIP_DEFLATED) as new_zip:
+                    copy_zip_entries(zip_file, new_zip, exclude=target_path)
+                    new_zip.writestr(entry, file_content, compress_type=compress_type)
+        
+        if not in_place:
+            # Replace original with modified version
+            os.replace(temp_zip, zip_path)
         
-        # Replace original with modified version
-        os.replace(temp_zip, zip_path)
         print(f"Successfully created '{target_path}' in '{zip_path}'")
         return True
         
+    except FileNotFoundError:
+        print(f"Error: ZIP file '{zip_path}' does not exist")
+        return False
     except zipfile.BadZipFile:
         print(f"Error: '{zip_path}' is not a valid ZIP file")
         if os.path.exists(temp_zip):
@@ -133,19 +359,21 @@ def create_file_in_zip(zip_path, target_path, file_content="", overwrite=False):
         return False
 
 def view_file_in_zip(zip_path, target_path):
-    """View the content of a file inside a ZIP archive."""
+    """View the content of a file inside a ZIP archive, decoding it incrementally."""
     try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_file:
-            if target_path not in zip_file.namelist():
+        with open_zip_for_read(zip_path) as zip_file:
+            if target_path not in zip_file.NameToInfo:
                 print(f"Error: File '{target_path}' not found in ZIP archive")
                 return None
             
-            content = zip_file.read(target_path).decode('utf-8', errors='replace')
             print(f"\n=== Content of '{target_path}' ===")
             print("-" * 50)
-            print(content)
+            with zip_file.open(target_path) as raw, \
+                    io.TextIOWrapper(raw, encoding='utf-8', errors='replace') as text:
+                shutil.copyfileobj(text, sys.stdout)
+            print()
             print("-" * 50)
-            return content
+            return True
             
     except zipfile.BadZipFile:
         print(f"Error: '{zip_path}' is not a valid ZIP file")
@@ -159,8 +387,8 @@ def view_file_in_zip(zip_path, target_path):
 def edit_file_in_zip(zip_path, target_path, use_editor=True):
     """Edit a file inside a ZIP archive using an external editor or inline."""
     try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_file:
-            if target_path not in zip_file.namelist():
+        with open_zip_for_read(zip_path) as zip_file:
+            if target_path not in zip_file.NameToInfo:
                 print(f"Error: File '{target_path}' not found in ZIP archive")
                 return False
             
@@ -182,15 +410,8 @@ def edit_file_in_zip(zip_path, target_path, use_editor=True):
             print("-" * 30)
             print("\nEnter new content (press Ctrl+D or Ctrl+Z to finish):")
             
-            content_lines = []
-            try:
-                while True:
-                    line = input()
-                    content_lines.append(line)
-            except EOFError:
-                pass
-            
-            new_content = '\n'.join(content_lines)
+            # Read everything up to EOF in one call rather than line by line
+            new_content = sys.stdin.read()
         
         # Update the file in ZIP
         return create_file_in_zip(zip_path, target_path, new_content, overwrite=True)
@@ -206,31 +427,22 @@ def edit_file_in_zip(zip_path, target_path, use_editor=True):
 
 def edit_with_external_editor(content, filename):
     """Open content in external editor and return modified content."""
-    # Try to determine the best editor
-    editors = [
-        #os.environ.get('EDITOR'),
-        'nano', 'vim', 'vi', 'code', 'subl', 'atom', 'gedit', 'notepad'
-    ]
-    
-    editor = None
-    for e in editors:
-        if e and subprocess.run(['which', e], capture_output=True).returncode == 0:
-            editor = e
-            break
+    # Try to determine the best editor; shutil.which scans PATH in-process
+    editor = next((e for e in EDITOR_CANDIDATES if shutil.which(e)), None)
     
     if not editor:
         print("No suitable text editor found. Using inline mode.")
         return None
     
     # Create temporary file
-    with tempfile.NamedTemporaryFile(mode='w', suffix=f'_{Path(filename).name}', delete=False) as tmp_file:
+    basename = filename.translate(PATH_NORMALIZE).rpartition('/')[2]
+    with tempfile.NamedTemporaryFile(mode='w', suffix=f'_{basename}', delete=False) as tmp_file:
         tmp_file.write(content)
         tmp_path = tmp_file.name
     
     try:
         # Open editor
-        #result = subprocess.run([editor, tmp_path])
-        result = subprocess.run(['nvim', tmp_path])
+        result = subprocess.run([editor, tmp_path])
         
         if result.returncode == 0:
             # Read modified content
@@ -253,51 +465,65 @@ def is_symlink_in_zip(info):
 def list_zip_contents(zip_path):
     """List all files and directories in the ZIP file."""
     try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_file:
-            print(f"\nContents of '{zip_path}':")
-            print("-" * 50)
+        with open_zip_for_read(zip_path) as zip_file:
+            # Collect all output and write it at once instead of per-entry print()
+            out = [f"\nContents of '{zip_path}':\n", "-" * 50 + "\n"]
+            append = out.append
             
             directories = set()
+            add_directory = directories.add
             files = []
             symlinks = []
             
-            for info in zip_file.infolist():
+            infos = zip_file.infolist()
+            
+            for info in infos:
                 # Extract directory paths
-                dir_path = '/'.join(info.filename.split('/')[:-1])
+                dir_path, sep, _ = info.filename.rpartition('/')
                 if dir_path:
-                    directories.add(dir_path + '/')
+                    add_directory(dir_path + sep)
                 
                 # Collect file info
-                if info.filename.endswith('/'):
-                    print(f"📁 {info.filename}")
+                if info.is_dir():
+                    append(f"📁 {info.filename}\n")
                 elif is_symlink_in_zip(info):
                     # Read symlink target
                     target = zip_file.read(info.filename).decode('utf-8')
-                    print(f"🔗 {info.filename} -> {target}")
-                    symlinks.append(info.filename)
+                    append(f"🔗 {info.filename} -> {target}\n")
+                    symlinks.append(info)
                 else:
-                    size_kb = info.file_size / 1024
-                    print(f"📄 {info.filename} ({size_kb:.1f} KB)")
-                    files.append(info.filename)
+                    append(f"📄 {info.filename} ({info.file_size / 1024:.1f} KB)\n")
+                    files.append(info)
             
-            print(f"\nAvailable directories for file creation:")
+            by_name = operator.attrgetter('filename')
+            
+            append("\nAvailable directories for file creation:\n")
             for directory in sorted(directories):
-                print(f"  📁 {directory}")
+                append(f"  📁 {directory}\n")
             
-            print(f"\nFiles available for viewing/editing:")
-            for file in sorted(files):
-                print(f"  📄 {file}")
+            append("\nFiles available for viewing/editing:\n")
+            for info in sorted(files, key=by_name):
+                append(f"  📄 {info.filename}\n")
             
             if symlinks:
-                print(f"\nSymbolic links:")
-                for symlink in sorted(symlinks):
-                    print(f"  🔗 {symlink}")
+                append("\nSymbolic links:\n")
+                for info in sorted(symlinks, key=by_name):
+                    append(f"  🔗 {info.filename}\n")
+            
+            sys.stdout.write("".join(out))
                 
     except zipfile.BadZipFile:
         print(f"Error: '{zip_path}' is not a valid ZIP file")
     except FileNotFoundError:
         print(f"Error: ZIP file '{zip_path}' not found")
 
+def ask_bool(prompt, default=False):
+    """Ask a yes/no question, deciding on the first character of the answer."""
+    answer = input(prompt)[:1]
+    if default:
+        return answer not in NO_ANSWERS
+    return answer in YES_ANSWERS
+
 def interactive_mode():
     """Interactive mode for managing files in ZIP archives."""
     print("=== ZIP File Modifier - Interactive Mode ===\n")
@@ -305,9 +531,14 @@ def interactive_mode():
     # Get ZIP file path
     while True:
         zip_path = input("Enter path to ZIP file: ").strip()
-        if os.path.exists(zip_path):
+        # Opening validates the path in one call; the listing below reports bad ZIPs
+        try:
+            os.close(os.open(zip_path, os.O_RDONLY))
             break
-        print("File not found. Please enter a valid path.\n")
+        except FileNotFoundError:
+            print("File not found. Please enter a valid path.\n")
+        except OSError:
+            print("File is not readable. Please enter a valid path.\n")
     
     while True:
         # List ZIP contents
@@ -332,16 +563,9 @@ def interactive_mode():
                 continue
             
             print(f"\nEnter content for the file (press Ctrl+D or Ctrl+Z to finish):")
-            content_lines = []
-            try:
-                while True:
-                    line = input()
-                    content_lines.append(line)
-            except EOFError:
-                pass
-            
-            file_content = '\n'.join(content_lines)
-            overwrite = input(f"\nOverwrite if file exists? (y/N): ").lower().startswith('y')
+            # Read everything up to EOF in one call rather than line by line
+            file_content = sys.stdin.read()
+            overwrite = ask_bool("\nOverwrite if file exists? (y/N): ")
             
             success = create_file_in_zip(zip_path, target_path, file_content, overwrite)
             if success:
@@ -361,7 +585,7 @@ def interactive_mode():
             if not target_path:
                 continue
                 
-            use_editor = input("Use external editor? (Y/n): ").lower() != 'n'
+            use_editor = ask_bool("Use external editor? (Y/n): ", default=True)
             success = edit_file_in_zip(zip_path, target_path, use_editor)
             
             if success:
@@ -385,7 +609,7 @@ def interactive_mode():
             if not symlink_target:
                 continue
             
-            overwrite = input(f"\nOverwrite if file exists? (y/N): ").lower().startswith('y')
+            overwrite = ask_bool("\nOverwrite if file exists? (y/N): ")
             
             success = create_symlink_in_zip(zip_path, target_path, symlink_target, overwrite)
             if success:
@@ -504,7 +728,8 @@ Examples:
     content = args.content
     if args.file:
         try:
-            with open(args.file, 'r', encoding='utf-8') as f:
+            # Read as bytes; the content is stored without a decode/encode round trip
+            with open(args.file, 'rb') as f:
                 content = f.read()
         except Exception as e:
             print(f"Error reading file '{args.file}': {e}")